@@ -1 +1,3 @@
 from .jpdatetime import jpdatetime
+from .era_table import (get_era_table, load_eras, reload_eras, era_year_to_gregorian, gregorian_to_era_years,
+                        era_year_to_gregorian_batch, gregorian_to_era_years_batch, encode_eras, era_categories)
@@ -0,0 +1,294 @@
+import calendar
+from bisect import bisect_right
+from datetime import date
+from functools import lru_cache
+from .era_table import get_era_table
+from .jpdatetime import jpdatetime, _map_batch
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = pc = None
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Era name column, separator and first-year notation for each custom format code
+era_format_columns = {
+    'format_full_jp_era': ('name_ja', '', '元'),
+    'format_abbr_jp_era': ('abbr_ja', '', None),
+    'format_full_en_era': ('name_en', ' ', None),
+    'format_abbr_en_era': ('abbr_en', '', None),
+}
+
+# Regex group names of the era codes and the era name column they refer to
+era_parse_columns = {
+    'era_full_jp': 'name_ja',
+    'era_abbr_jp': 'abbr_ja',
+    'era_full_en': 'name_en',
+    'era_abbr_en': 'abbr_en',
+}
+
+
+def _require_pyarrow():
+    """Raises an ImportError if pyarrow is not installed."""
+    if pa is None:
+        raise ImportError("pyarrow is required for jpdatetime.arrow: python -m pip install pyarrow")
+
+
+@lru_cache(maxsize=8)
+def _era_lookup(table):
+    """Builds the era lookup arrays sorted by start date in ascending order."""
+    _require_pyarrow()
+    ordered = table.ascending
+    columns = {
+        'name_ja': [era['name_ja'] for era in ordered],
+        'abbr_ja': [era['name_ja'][0] for era in ordered],
+        'name_en': [era['name_en'] for era in ordered],
+        'abbr_en': [era['name_en'][0] for era in ordered],
+    }
+    return {
+        'start_days': [ordinal - EPOCH_ORDINAL for ordinal in table.start_ordinals],
+        'start_years': pa.array([era['start_date'].year for era in ordered], pa.int64()),
+        'columns': {name: pa.array(values, pa.string()) for name, values in columns.items()},
+    }
+
+
+@lru_cache(maxsize=32)
+def _era_parse_lookup(table, column):
+    """Maps era names of a column to the start year of the newest era using that name."""
+    _require_pyarrow()
+    start_years = {}
+    for era in table.eras:
+        name = {'name_ja': era['name_ja'], 'abbr_ja': era['name_ja'][0],
+                'name_en': era['name_en'], 'abbr_en': era['name_en'][0]}[column]
+        start_years.setdefault(name, era['start_date'].year)
+    return pa.array(list(start_years), pa.string()), pa.array(list(start_years.values()), pa.int64())
+
+
+def _map_chunks(func, array, *args, workers=None):
+    """Applies an array kernel chunk by chunk to an Array or ChunkedArray.
+
+    With workers, the chunks of a ChunkedArray are processed on a thread pool.
+    """
+    _require_pyarrow()
+    if isinstance(array, pa.ChunkedArray):
+        chunks = _map_batch(lambda chunk: func(chunk, *args), array.chunks, workers)
+        if not chunks:
+            return pa.chunked_array([], func(pa.array([], array.type), *args).type)
+        return pa.chunked_array(chunks)
+    return func(array, *args)
+
+
+def _to_date32(array):
+    """Casts a date, timestamp or string array to date32."""
+    if pa.types.is_date32(array.type):
+        return array
+    if pa.types.is_timestamp(array.type) and array.type.tz is not None:
+        # Use the local calendar date of timezone-aware timestamps
+        array = pc.local_timestamp(array)
+    return pc.cast(array, pa.date32(), safe=False)
+
+
+def _era_indices(days, table):
+    """Returns the int16 index into the ascending era table for each day since the epoch."""
+    start_days = _era_lookup(table)['start_days']
+    min_max = pc.min_max(days).as_py()
+    if min_max['min'] is None:
+        return pa.nulls(len(days), pa.int16())
+    first = bisect_right(start_days, min_max['min']) - 1
+    last = bisect_right(start_days, min_max['max']) - 1
+    if first < 0:
+        raise ValueError("Date out of range for Japanese eras")
+    # Only the era boundaries between the chunk minimum and maximum are compared
+    indices = pc.multiply(pc.cast(pc.greater_equal(days, start_days[first]), pa.int16()), first)
+    for i in range(first + 1, last + 1):
+        indices = pc.add(indices, pc.cast(pc.greater_equal(days, start_days[i]), pa.int16()))
+    # Every chunk gets the same index type, so chunks and batches share one dictionary type
+    return pc.cast(indices, pa.int16())
+
+
+def _era_names_chunk(array, column, table):
+    dates = _to_date32(array)
+    indices = _era_indices(pc.cast(dates, pa.int32()), table)
+    dictionary = _era_lookup(table)['columns'][column]
+    return pa.DictionaryArray.from_arrays(indices, dictionary)
+
+
+def era_names(array, column='name_ja', workers=None):
+    """Returns the dictionary-encoded era name for each date or timestamp.
+
+    The column is one of 'name_ja', 'abbr_ja', 'name_en' or 'abbr_en'.
+    """
+    _require_pyarrow()
+    table = get_era_table()
+    if column not in _era_lookup(table)['columns']:
+        raise ValueError(f"unknown era name column '{column}'")
+    return _map_chunks(_era_names_chunk, array, column, table, workers=workers)
+
+
+def _era_years_chunk(array, table):
+    dates = _to_date32(array)
+    indices = _era_indices(pc.cast(dates, pa.int32()), table)
+    start_years = pc.take(_era_lookup(table)['start_years'], indices)
+    return pc.add(pc.subtract(pc.year(dates), start_years), 1)
+
+
+def era_years(array, workers=None):
+    """Returns the era year for each date or timestamp."""
+    return _map_chunks(_era_years_chunk, array, get_era_table(), workers=workers)
+
+
+def _hour12(timestamps):
+    hour = pc.hour(timestamps)
+    return pc.if_else(pc.equal(hour, 0), 12, pc.if_else(pc.greater(hour, 12), pc.subtract(hour, 12), hour))
+
+
+def _short_year(timestamps):
+    year = pc.year(timestamps)
+    return pc.subtract(year, pc.multiply(pc.divide(year, 100), 100))
+
+
+# Date fields for standard format codes with the - (no padding) modifier
+unpadded_fields = {
+    'Y': lambda timestamps: pc.year(timestamps),
+    'y': _short_year,
+    'm': lambda timestamps: pc.month(timestamps),
+    'd': lambda timestamps: pc.day(timestamps),
+    'j': lambda timestamps: pc.day_of_year(timestamps),
+    'H': lambda timestamps: pc.hour(timestamps),
+    'I': _hour12,
+    'M': lambda timestamps: pc.minute(timestamps),
+    'S': lambda timestamps: pc.second(timestamps),
+}
+
+
+def _format_standard(timestamps, chunk):
+    """Formats a standard strftime chunk, building codes with the - modifier from the date fields."""
+    parts = []
+    pending = ''
+    for token_type, token_value in jpdatetime._tokenize_format_string(chunk):
+        if token_type == 'format_code' and token_value[0]:
+            modifier, code = token_value
+            # pyarrow.compute.strftime does not support modifiers, and # is platform dependent
+            if modifier != '-' or code not in unpadded_fields:
+                raise ValueError(f"format code '%{modifier}{code}' is not supported by jpdatetime.arrow")
+            if pending:
+                parts.append(pc.strftime(timestamps, format=pending, locale='C'))
+                pending = ''
+            parts.append(pc.cast(unpadded_fields[code](timestamps), pa.string()))
+        elif token_type == 'format_code':
+            pending += '%' + token_value[1]
+        else:
+            pending += token_value
+    if pending:
+        parts.append(pc.strftime(timestamps, format=pending, locale='C'))
+    return parts
+
+
+def _strftime_chunk(array, format_string, table):
+    dates = _to_date32(array)
+    timestamps = array if pa.types.is_timestamp(array.type) else pc.cast(dates, pa.timestamp('s'))
+    indices = _era_indices(pc.cast(dates, pa.int32()), table)
+    lookup = _era_lookup(table)
+    era_year = pc.add(pc.subtract(pc.year(dates), pc.take(lookup['start_years'], indices)), 1)
+
+    parts = []
+    for is_era, value in jpdatetime._compile_format_segments(format_string):
+        if is_era:
+            handler_name, modifier = value
+            column, separator, first_year = era_format_columns[handler_name]
+            year_str = pc.cast(era_year, pa.string())
+            if '-' not in modifier and '#' not in modifier:
+                year_str = pc.utf8_lpad(year_str, width=2, padding='0')
+            if first_year:
+                year_str = pc.if_else(pc.equal(era_year, 1), first_year, year_str)
+            parts.append(pc.binary_join_element_wise(pc.take(lookup['columns'][column], indices), year_str, separator))
+        else:
+            parts.extend(_format_standard(timestamps, value))
+    if not parts:
+        return pc.if_else(pc.is_valid(dates), '', pa.scalar(None, pa.string()))
+    return pc.binary_join_element_wise(*parts, '')
+
+
+def strftime(array, format_string, workers=None):
+    """Formats each date or timestamp with the jpdatetime format string.
+
+    Era segments are built from the precomputed era table and standard
+    directives are delegated to pyarrow.compute.strftime. Nulls are propagated.
+    """
+    return _map_chunks(_strftime_chunk, array, format_string, get_era_table(), workers=workers)
+
+
+def _to_int(array):
+    return pc.cast(array, pa.int64())
+
+
+def _strptime_rows(array, format_string):
+    """Parses each string with jpdatetime.strptime, keeping nulls."""
+    values = [jpdatetime.strptime(value, format_string).date() if value is not None else None
+              for value in array.to_pylist()]
+    return pa.array(values, pa.date32())
+
+
+def _strptime_chunk(array, format_string, table):
+    normalized = pc.utf8_normalize(array, form='NFKC')
+    parts = pc.extract_regex(normalized, pattern='^' + jpdatetime._build_regex_pattern(format_string, table))
+    matched = pc.is_valid(parts)
+    fields = pc.filter(parts, matched)
+    field_names = {fields.type.field(i).name for i in range(fields.type.num_fields)}
+
+    year = None
+    for group, column in era_parse_columns.items():
+        if group in field_names:
+            names, start_years = _era_parse_lookup(table, column)
+            start_year = pc.take(start_years, pc.index_in(fields.field(group), value_set=names))
+            era_year = pc.if_else(pc.is_in(fields.field('era_year'), value_set=pa.array(['元', 'First'])),
+                                  '1', fields.field('era_year'))
+            year = pc.subtract(pc.add(start_year, _to_int(era_year)), 1)
+            break
+    if year is None and 'year' in field_names:
+        year = _to_int(fields.field('year'))
+    if 'month' in field_names:
+        month = _to_int(fields.field('month'))
+    elif 'month_name' in field_names:
+        # Month names are matched case-insensitively, as datetime.strptime does
+        month_names = pa.array([name.lower() for name in calendar.month_name[1:]], pa.string())
+        month = pc.add(pc.index_in(pc.utf8_lower(fields.field('month_name')), value_set=month_names), 1)
+    elif 'month_abbr' in field_names:
+        month_abbrs = pa.array([name.lower() for name in calendar.month_abbr[1:]], pa.string())
+        month = pc.add(pc.index_in(pc.utf8_lower(fields.field('month_abbr')), value_set=month_abbrs), 1)
+    else:
+        month = None
+    day = _to_int(fields.field('day')) if 'day' in field_names else None
+    if year is None or month is None or day is None:
+        # Dates built from other fields (e.g. %j or %y) are left to jpdatetime.strptime;
+        # time fields do not change the date and are ignored
+        return _strptime_rows(array, format_string)
+
+    iso = pc.binary_join_element_wise(
+        pc.utf8_lpad(pc.cast(year, pa.string()), width=4, padding='0'),
+        pc.utf8_lpad(pc.cast(month, pa.string()), width=2, padding='0'),
+        pc.utf8_lpad(pc.cast(day, pa.string()), width=2, padding='0'),
+        '-',
+    )
+    result = pc.replace_with_mask(pa.nulls(len(array), pa.date32()), matched, pc.cast(iso, pa.date32()))
+    # Matched rows with an unknown era or month name are left to the fallback
+    incomplete = pc.replace_with_mask(pc.fill_null(pa.nulls(len(array), pa.bool_()), False), matched,
+                                      pc.is_null(iso))
+
+    # Strings outside the vectorized path (e.g. kanji numerals) are parsed one by one
+    fallback = pc.and_(pc.is_valid(array), pc.or_(pc.invert(matched), incomplete))
+    if pc.any(fallback).as_py():
+        values = [jpdatetime.strptime(value, format_string).date()
+                  for value in pc.filter(array, fallback).to_pylist()]
+        result = pc.replace_with_mask(result, fallback, pa.array(values, pa.date32()))
+    return result
+
+
+def strptime(array, format_string, workers=None):
+    """Parses each string with the jpdatetime format string into a date32 array.
+
+    Nulls are propagated and strings that do not match raise a ValueError.
+    """
+    return _map_chunks(_strptime_chunk, array, format_string, get_era_table(), workers=workers)
@@ -0,0 +1,323 @@
+import os
+import json
+import calendar
+import numbers
+import operator
+import threading
+from array import array
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+
+# Load the eras data from an external JSON file
+module_dir = os.path.dirname(os.path.abspath(__file__))
+eras_file_path = os.path.join(module_dir, 'config/eras.json')
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class EraTable:
+    """Immutable snapshot of the era table and the lookup structures derived from it.
+
+    All derived structures are built in the constructor, so a table can be
+    shared between threads and read without locking. Tables are hashed and
+    compared by identity, so caches keyed on a table are invalidated as soon
+    as a new table is loaded. The generation only counts the loads.
+
+    Eras are kept in the order given, newest first. As in config/eras.json,
+    an era listed after one that starts earlier (the Southern Court eras of
+    1336-1392) is a parallel era: it is used to parse era names, but dates
+    are formatted with the era listed first. An era ends where the era listed
+    before it starts, or after its optional 'end_date'.
+    """
+    __slots__ = ('eras', 'ascending', 'start_dates', 'start_ordinals', 'era_indexes', 'regex_fragments',
+                 'eras_by_year', 'generation', '_year_spans', '_spans_by_year')
+
+    def __init__(self, eras_data, generation=0):
+        self.generation = generation
+        eras = []
+        for era in eras_data:
+            entry = {'name_ja': era['name_ja'], 'name_en': era['name_en']}
+            for key in ('start_date', 'end_date'):
+                value = era.get(key)
+                if isinstance(value, str):
+                    # Parse the dates into datetime objects
+                    value = datetime.strptime(value, '%Y-%m-%d')
+                if value is not None:
+                    entry[key] = value
+            eras.append(MappingProxyType(entry))
+        if not eras:
+            raise ValueError("The era table must contain at least one era")
+        self.eras = tuple(eras)
+        # Eras used for date lookups, oldest first: the first era in list order that
+        # starts on or before a date is the era of that date, so parallel eras are skipped
+        lookup = []
+        for era in self.eras:
+            if not lookup or era['start_date'] < lookup[-1]['start_date']:
+                lookup.append(era)
+        self.ascending = tuple(reversed(lookup))
+        self.start_dates = tuple(era['start_date'] for era in self.ascending)
+        self.start_ordinals = tuple(start_date.toordinal() for start_date in self.start_dates)
+
+        # Map era names to eras; on duplicate abbreviations the era listed first wins
+        era_indexes = {'era_full_jp': {}, 'era_abbr_jp': {}, 'era_full_en': {}, 'era_abbr_en': {}}
+        for era in self.eras:
+            era_indexes['era_full_jp'].setdefault(era['name_ja'], era)
+            era_indexes['era_abbr_jp'].setdefault(era['name_ja'][0], era)
+            era_indexes['era_full_en'].setdefault(era['name_en'], era)
+            era_indexes['era_abbr_en'].setdefault(era['name_en'][0], era)
+        self.era_indexes = MappingProxyType({
+            group: MappingProxyType(index) for group, index in era_indexes.items()
+        })
+
+        # Regex fragments for the custom era format codes
+        self.regex_fragments = MappingProxyType({
+            'era_full_jp': '|'.join([era['name_ja'] for era in self.eras]),
+            'era_abbr_jp': ''.join([era['name_ja'][0] for era in self.eras]),
+            'era_full_en': '|'.join([era['name_en'] for era in self.eras]),
+            'era_abbr_en': ''.join([era['name_en'][0] for era in self.eras]),
+        })
+
+        # Each era ends where the next era of the same court starts, i.e. the era
+        # listed just before it if that one starts later; the newest era has no end
+        spans = []
+        for i, era in enumerate(self.eras):
+            if 'end_date' in era:
+                end = era['end_date'] + timedelta(days=1)
+            elif i > 0 and self.eras[i - 1]['start_date'] > era['start_date']:
+                end = self.eras[i - 1]['start_date']
+            else:
+                end = None
+            spans.append((era, end))
+        spans.sort(key=lambda span: span[0]['start_date'])
+
+        # Gregorian years covered by each era, keyed by name and start date
+        year_spans = {}
+        spans_by_year = {}
+        for era, end in spans:
+            first_year = era['start_date'].year
+            if end is None:
+                last_year = None
+            elif (end.month, end.day) == (1, 1):
+                last_year = end.year - 1
+            else:
+                last_year = end.year
+            year_spans[era['name_ja'], era['start_date']] = (first_year, last_year)
+            # Eras active in each Gregorian year up to the start of the newest era, oldest first
+            for year in range(first_year, (last_year or first_year) + 1):
+                spans_by_year.setdefault(year, []).append(
+                    (era['name_ja'], year - first_year + 1, era['start_date'], end))
+        self._year_spans = year_spans
+        self._spans_by_year = {year: tuple(entries) for year, entries in spans_by_year.items()}
+        self.eras_by_year = MappingProxyType({
+            year: tuple((name, era_year) for name, era_year, _, _ in entries)
+            for year, entries in self._spans_by_year.items()
+        })
+
+    def get_era_index(self, dt):
+        """Returns the index of the era in effect on a datetime in the ascending era table."""
+        # Era boundaries are wall-clock dates, so aware datetimes are compared by their local time
+        index = bisect_right(self.start_dates, dt.replace(tzinfo=None)) - 1
+        if index < 0:
+            raise ValueError("Date out of range for Japanese eras")
+        return index
+
+    def get_era(self, dt):
+        """Returns the era in effect on a datetime."""
+        return self.ascending[self.get_era_index(dt)]
+
+    def find_era(self, name):
+        """Returns the era with the given Japanese or English name or abbreviation."""
+        for group in ('era_full_jp', 'era_full_en', 'era_abbr_jp', 'era_abbr_en'):
+            era = self.era_indexes[group].get(name)
+            if era is not None:
+                return era
+        raise ValueError(f"unknown era '{name}'")
+
+    def era_year_to_gregorian(self, era_name, era_year):
+        """Returns the Gregorian year of a year in the named era."""
+        era = self.find_era(era_name)
+        first_year, last_year = self._year_spans[era['name_ja'], era['start_date']]
+        year = first_year + era_year - 1
+        if era_year < 1 or (last_year is not None and year > last_year):
+            raise ValueError(f"year {era_year} is out of range for era '{era_name}'")
+        return year
+
+    def gregorian_to_era_years(self, year, month=None):
+        """Returns the (era name, era year) pairs of every era active in the Gregorian year, oldest first.
+
+        If a month is given, only the eras active in that month are returned.
+        """
+        if month is not None:
+            return self._month_to_era_years(year, month)
+        pairs = self.eras_by_year.get(year)
+        if pairs is not None:
+            return pairs
+        newest = self.ascending[-1]
+        if year > newest['start_date'].year:
+            return ((newest['name_ja'], year - newest['start_date'].year + 1),)
+        raise ValueError(f"year {year} is out of range for Japanese eras")
+
+    def _month_to_era_years(self, year, month):
+        """Returns the (era name, era year) pairs of the eras active in a Gregorian month, oldest first."""
+        first_day = datetime(year, month, 1)
+        last_day = first_day.replace(day=calendar.monthrange(year, month)[1])
+        entries = self._spans_by_year.get(year)
+        if entries is None:
+            # Years after the start of the newest era
+            return self.gregorian_to_era_years(year)
+        pairs = tuple((name, era_year) for name, era_year, start, end in entries
+                      if start <= last_day and (end is None or end > first_day))
+        if not pairs:
+            raise ValueError(f"month {year}-{month:02d} is out of range for Japanese eras")
+        return pairs
+
+    def categories(self, column='name_ja'):
+        """Returns the decode table of era codes: the era names indexed by code, oldest first."""
+        if column not in ('name_ja', 'name_en'):
+            raise ValueError(f"unknown era name column '{column}'")
+        return tuple(era[column] for era in self.ascending)
+
+    def encode(self, values):
+        """Returns era codes and era years for dates, datetimes or proleptic Gregorian ordinals.
+
+        Era codes index the categories() decode table. Codes are returned as
+        array('h') and era years as array('i'); NumPy datetime64 or integer
+        ordinal arrays are encoded with vectorized lookups into NumPy arrays.
+        Missing values (None, NaT) get code -1 and era year 0.
+        """
+        kind = getattr(getattr(values, 'dtype', None), 'kind', None)
+        if kind in ('M', 'i', 'u'):
+            return self._encode_numpy(values, kind)
+
+        codes = array('h')
+        era_years = array('i')
+        start_ordinals = self.start_ordinals
+        # Sorted input mostly stays within the current era, so bisect only on a range miss
+        lower = upper = first_year = 0
+        index = -1
+        for value in values:
+            if value is None:
+                codes.append(-1)
+                era_years.append(0)
+                continue
+            if isinstance(value, numbers.Integral):
+                # Plain and NumPy integers are ordinals
+                ordinal = operator.index(value)
+                year = date.fromordinal(ordinal).year
+            else:
+                ordinal = value.toordinal()
+                year = value.year
+            if not lower <= ordinal < upper:
+                index = bisect_right(start_ordinals, ordinal) - 1
+                if index < 0:
+                    raise ValueError("Date out of range for Japanese eras")
+                lower = start_ordinals[index]
+                upper = start_ordinals[index + 1] if index + 1 < len(start_ordinals) else date.max.toordinal() + 1
+                first_year = self.start_dates[index].year
+            codes.append(index)
+            era_years.append(year - first_year + 1)
+        return codes, era_years
+
+    def _encode_numpy(self, values, kind):
+        """Encodes NumPy datetime64 or ordinal arrays with searchsorted on the start ordinals."""
+        import numpy as np
+        if kind == 'M':
+            days = values.astype('datetime64[D]')
+            missing = np.isnat(days)
+            ordinals = days.astype('int64') + EPOCH_ORDINAL
+        else:
+            ordinals = values.astype('int64')
+            missing = np.zeros(ordinals.shape, dtype=bool)
+            days = (ordinals - EPOCH_ORDINAL).astype('datetime64[D]')
+        codes = np.searchsorted(np.asarray(self.start_ordinals), ordinals, side='right') - 1
+        if np.any((codes < 0) & ~missing):
+            raise ValueError("Date out of range for Japanese eras")
+        codes[missing] = -1
+        years = days.astype('datetime64[Y]').astype('int64') + 1970
+        start_years = np.asarray([start_date.year for start_date in self.start_dates])
+        era_years = np.where(missing, 0, years - start_years[np.maximum(codes, 0)] + 1)
+        return codes.astype(np.int16), era_years.astype(np.int32)
+
+    def get_next_start_date(self, dt):
+        """Returns the start date of the era following the one in effect, or None."""
+        index = bisect_right(self.start_dates, dt.replace(tzinfo=None))
+        return self.start_dates[index] if index < len(self.start_dates) else None
+
+
+def _read_eras_file(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+_era_table = EraTable(_read_eras_file(eras_file_path))
+_eras_source = eras_file_path
+_load_lock = threading.Lock()
+
+
+def get_era_table():
+    """Returns the current era table snapshot."""
+    return _era_table
+
+
+def load_eras(path_or_data):
+    """Loads an era table from a JSON file path or a list of era dicts and swaps it in.
+
+    The new table and all of its derived structures are built before the swap,
+    so parses running on other threads keep using a consistent snapshot.
+    """
+    global _era_table, _eras_source
+    if isinstance(path_or_data, (str, os.PathLike)):
+        eras_data = _read_eras_file(path_or_data)
+    else:
+        eras_data = path_or_data = list(path_or_data)
+    with _load_lock:
+        table = EraTable(eras_data, generation=_era_table.generation + 1)
+        # Rebinding the module global is atomic; readers see either the old or the new table
+        _era_table = table
+        _eras_source = path_or_data
+    return table
+
+
+def era_year_to_gregorian(era, era_year):
+    """Returns the Gregorian year of a year in an era given by name or abbreviation (e.g. "平成", "R")."""
+    return _era_table.era_year_to_gregorian(era, era_year)
+
+
+def gregorian_to_era_years(year, month=None):
+    """Returns the (era name, era year) pairs of every era active in the Gregorian year or month, oldest first."""
+    return _era_table.gregorian_to_era_years(year, month)
+
+
+def era_year_to_gregorian_batch(eras, era_years):
+    """Converts pairs of era names and era years into Gregorian years."""
+    table = _era_table
+    return [table.era_year_to_gregorian(era, era_year) for era, era_year in zip(eras, era_years)]
+
+
+def gregorian_to_era_years_batch(years, months=None):
+    """Returns the (era name, era year) pairs active in each Gregorian year, or in each month if months are given."""
+    table = _era_table
+    if months is None:
+        return [table.gregorian_to_era_years(year) for year in years]
+    return [table.gregorian_to_era_years(year, month) for year, month in zip(years, months)]
+
+
+def encode_eras(values, table=None):
+    """Returns era codes and era years for dates, datetimes, ordinals or datetime64 arrays.
+
+    See EraTable.encode. The codes must be decoded with era_categories() from
+    the same era table; pass the same table snapshot to both calls if
+    load_eras() may run in between.
+    """
+    return (table or _era_table).encode(values)
+
+
+def era_categories(column='name_ja', table=None):
+    """Returns the era names indexed by the codes of encode_eras(), oldest first."""
+    return (table or _era_table).categories(column)
+
+
+def reload_eras():
+    """Reloads the era table from the last loaded source (config/eras.json by default)."""
+    return load_eras(_eras_source)
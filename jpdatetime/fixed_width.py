@@ -0,0 +1,130 @@
+import re
+import mmap
+from array import array
+from datetime import date
+from functools import lru_cache
+from .era_table import get_era_table
+from .jpdatetime import jpdatetime
+
+
+def _encode_alternatives(values, encoding):
+    """Encodes values for a bytes regex, skipping values the encoding cannot represent."""
+    encoded = {}
+    for value in values:
+        try:
+            encoded.setdefault(value.encode(encoding), value)
+        except UnicodeEncodeError:
+            continue
+    return encoded
+
+
+@lru_cache(maxsize=128)
+def _compile_byte_pattern(format_string, encoding, table):
+    """Compiles the format string into a bytes regex and the era lookup tables for the encoding."""
+    # Half-width and full-width digits as byte sequences in the target encoding
+    digit_bytes = _encode_alternatives('0123456789０１２３４５６７８９', encoding)
+    digit = b'(?:' + b'|'.join(re.escape(d) for d in digit_bytes) + b')'
+    first_year = '元'.encode(encoding)
+
+    # Map encoded era names to era entries; newer eras win on duplicate initials
+    era_lookup = {'era_full_jp': {}, 'era_abbr_jp': {}, 'era_full_en': {}, 'era_abbr_en': {}}
+    for era in table.eras:
+        for group, name in (('era_full_jp', era['name_ja']), ('era_abbr_jp', era['name_ja'][0]),
+                            ('era_full_en', era['name_en']), ('era_abbr_en', era['name_en'][0])):
+            for encoded in _encode_alternatives([name], encoding):
+                era_lookup[group].setdefault(encoded, era)
+
+    def alternatives(group):
+        names = sorted(era_lookup[group], key=lambda x: -len(x))
+        return b'|'.join(re.escape(name) for name in names)
+
+    regex_patterns = {
+        'G': b'(?P<era_full_jp>' + alternatives('era_full_jp') + b')(?P<era_year>' + re.escape(first_year) + b'|' + digit + b'+)',
+        'g': b'(?P<era_abbr_jp>' + alternatives('era_abbr_jp') + b')(?P<era_year>' + re.escape(first_year) + b'|' + digit + b'+)',
+        'E': b'(?P<era_full_en>' + alternatives('era_full_en') + b') (?P<era_year>First|' + digit + b'+)',
+        'e': b'(?P<era_abbr_en>' + alternatives('era_abbr_en') + b')(?P<era_year>First|' + digit + b'+)',
+        'Y': b'(?P<year>' + digit + b'{4})',
+        'm': b'(?P<month>' + digit + b'{1,2})',
+        'd': b'(?P<day>' + digit + b'{1,2})',
+    }
+
+    regex_pattern = b' *'
+    for token_type, token_value in jpdatetime._tokenize_format_string(format_string):
+        if token_type == 'format_code':
+            modifier, code = token_value
+            if code not in regex_patterns:
+                raise ValueError(f"format code '%{code}' is not supported for fixed-width input")
+            regex_pattern += regex_patterns[code]
+        else:
+            regex_pattern += re.escape(token_value.encode(encoding))
+    return re.compile(regex_pattern), era_lookup, first_year
+
+
+def _to_int(value, encoding):
+    """Converts matched digit bytes into an integer."""
+    try:
+        return int(value)
+    except ValueError:
+        # Full-width digits are decoded and handled by int() as Unicode decimals
+        return int(value.decode(encoding))
+
+
+def _match_to_ordinal(match, era_lookup, first_year, encoding):
+    """Calculates the proleptic Gregorian ordinal from a bytes regex match."""
+    components = match.groupdict()
+    year = None
+    for group, lookup in era_lookup.items():
+        if components.get(group):
+            era = lookup[components[group]]
+            era_year_bytes = components['era_year']
+            if era_year_bytes in (first_year, b'First'):
+                era_year = 1
+            else:
+                era_year = _to_int(era_year_bytes, encoding)
+            year = era['start_date'].year + era_year - 1
+            break
+    if year is None and components.get('year'):
+        year = _to_int(components['year'], encoding)
+    if None in (year, components.get('month'), components.get('day')):
+        raise ValueError("Incomplete date information")
+    return date(year, _to_int(components['month'], encoding), _to_int(components['day'], encoding)).toordinal()
+
+
+def iter_ordinals(path, format_string, record_length, offset=0, width=None, encoding='utf-8'):
+    """Yields the date ordinal of each fixed-width record in the file.
+
+    The file is memory-mapped and the date field is matched in place with a
+    precompiled bytes pattern, so records are never decoded to str. Fields that
+    do not match the fast path (e.g. kanji numerals) fall back to jpdatetime.strptime.
+    """
+    if width is None:
+        width = record_length - offset
+    if record_length <= 0 or offset < 0 or width <= 0 or offset + width > record_length:
+        raise ValueError("field must lie within a record of positive length")
+    pattern, era_lookup, first_year = _compile_byte_pattern(format_string, encoding, get_era_table())
+
+    with open(path, 'rb') as f:
+        f.seek(0, 2)
+        if f.tell() == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            record_start = 0
+            while record_start + offset + width <= size:
+                field_start = record_start + offset
+                field_end = field_start + width
+                match = pattern.match(mm, field_start, field_end)
+                if match:
+                    yield _match_to_ordinal(match, era_lookup, first_year, encoding)
+                else:
+                    field = mm[field_start:field_end].decode(encoding).strip()
+                    yield jpdatetime.strptime(field, format_string).toordinal()
+                record_start += record_length
+
+
+def read_ordinals(path, format_string, record_length, offset=0, width=None, encoding='utf-8', out=None):
+    """Reads the date ordinal of each fixed-width record into an array('i')."""
+    if out is None:
+        out = array('i')
+    out.extend(iter_ordinals(path, format_string, record_length, offset, width, encoding))
+    return out
@@ -1,22 +1,29 @@
-import os
 import re
-import json
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone, MAXYEAR
+from functools import lru_cache
 import unicodedata
+from .era_table import get_era_table
 from .kanji_to_num import replace_kanji_numerals
 
-# Load the eras data from an external JSON file
-module_dir = os.path.dirname(os.path.abspath(__file__))
-eras_file_path = os.path.join(module_dir, 'config/eras.json')
 
-with open(eras_file_path, 'r', encoding='utf-8') as f:
-    eras_data = json.load(f)
+def __getattr__(name):
+    # Read-only compatibility alias: `eras` is the current era table in config/eras.json order
+    if name == 'eras':
+        return get_era_table().eras
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Parse the start dates into datetime objects
-eras = []
-for era in eras_data:
-    era['start_date'] = datetime.strptime(era['start_date'], '%Y-%m-%d')
-    eras.append(era)
+
+def _map_batch(func, values, workers=None):
+    """Applies func to each value, splitting the values into chunks across a thread pool."""
+    values = list(values)
+    if not workers or workers <= 1 or len(values) < 2:
+        return [func(value) for value in values]
+    chunk_size = -(-len(values) // (workers * 4))
+    chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda chunk: [func(value) for value in chunk], chunks)
+        return [result for chunk in results for result in chunk]
 
 class jpdatetime(datetime):
     # Unified custom format codes mapping to their handler functions
@@ -30,62 +37,186 @@ class jpdatetime(datetime):
     @classmethod
     def strptime(cls, date_string, format_string):
         date_string = cls._standardize_date_strings(date_string)
+        # Use a single era table snapshot for the whole parse
+        table = get_era_table()
+        regex = cls._compile_regex_pattern(format_string, table)
         # Check if custom era format codes are in the format string
-        if any(re.search(f'%[-#]*{code}', format_string) for code in cls.custom_formats):
-            # Split the format string into tokens
-            tokens = cls._tokenize_format_string(format_string)
-            regex_pattern = ''
-            for token_type, token_value in tokens:
-                if token_type == 'format_code':
-                    modifier, code = token_value
-                    if code in cls.custom_formats:
-                        # Get the regex pattern for the custom format code
-                        handler_name = cls.custom_formats[code]['parse']
-                        handler = getattr(cls, f"_get_regex_{handler_name}")
-                        regex_pattern += handler()
-                    else:
-                        # Use the standard datetime regex patterns
-                        regex_pattern += cls._escape_regex('%' + code)
-                else:
-                    # Escape literals in the regex pattern
-                    regex_pattern += re.escape(token_value)
-            # Compile the regex pattern
-            match = re.match(regex_pattern, date_string)
+        if regex is not None:
+            match = regex.match(date_string)
             if not match:
                 raise ValueError(f"time data '{date_string}' does not match format '{format_string}'")
             # Extract date components from matched groups
             components = match.groupdict()
-            year, month, day = cls._extract_date_components(components)
-            return cls(year, month, day)
+            year, month, day = cls._extract_date_components(components, table)
+            hour, minute, second, microsecond, tzinfo = cls._extract_time_components(components)
+            return cls(year, month, day, hour, minute, second, microsecond, tzinfo)
         else:
             # Use standard datetime parsing for formats without custom codes
             dt = datetime.strptime(date_string, format_string)
             return cls(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second, dt.microsecond)
 
     def strftime(self, format_string):
+        segments = self._compile_format_segments(format_string)
         # Check if custom era format codes are in the format string
-        if any(re.search(f'%[-#]*{code}', format_string) for code in self.custom_formats):
-            tokens = self._tokenize_format_string(format_string)
-            result = ''
-            for token_type, token_value in tokens:
-                if token_type == 'format_code':
-                    modifier, code = token_value
-                    if code in self.custom_formats:
-                        # Call the handler function for the custom format code
-                        handler_name = self.custom_formats[code]['format']
-                        handler = getattr(self, f"_{handler_name}")
-                        result += handler(modifier)
-                    else:
-                        # Use standard datetime strftime for other format codes
-                        result += super().strftime('%' + modifier + code)
-                else:
-                    # Append literals as is
-                    result += token_value
-            return result
+        if any(is_era for is_era, value in segments):
+            table = get_era_table()
+            # Call the handler function for custom format codes and standard strftime for the rest
+            return ''.join(
+                getattr(self, f"_{value[0]}")(value[1], table) if is_era else datetime.strftime(self, value)
+                for is_era, value in segments
+            )
         else:
             # Use standard datetime strftime for formats without custom codes
             return super().strftime(format_string)
 
+    @classmethod
+    def format_range(cls, start, end, format_string, step=timedelta(days=1)):
+        """Yields formatted strings for each date from start (inclusive) to end (exclusive).
+
+        The format string is compiled once and the era portion is only recomputed
+        when the walk crosses a year or era boundary.
+        """
+        if step <= timedelta(0):
+            raise ValueError("step must be a positive timedelta")
+        segments = cls._compile_format_segments(format_string)
+        table = get_era_table()
+        current = cls._from_date(start)
+        end = cls._from_date(end)
+        boundary = current
+        era_strings = {}
+        while current < end:
+            if current >= boundary:
+                # Recompute the era portion only when a year or era boundary is crossed
+                era_strings = {
+                    i: getattr(current, f"_{value[0]}")(value[1], table)
+                    for i, (is_era, value) in enumerate(segments) if is_era
+                }
+                boundary = current._get_next_era_boundary(table)
+            yield ''.join(
+                era_strings[i] if is_era else datetime.strftime(current, value)
+                for i, (is_era, value) in enumerate(segments)
+            )
+            current += step
+
+    @classmethod
+    def sort_key(cls, date_string, format_string):
+        """Returns an integer key that orders date strings chronologically.
+
+        See key_func for details.
+        """
+        return cls._compile_sort_key(format_string, get_era_table())(date_string)
+
+    @classmethod
+    def key_func(cls, format_string):
+        """Returns a key function for sorting and comparing date strings in the given format.
+
+        Keys are calculated from the era start year and the matched digits without
+        constructing datetime objects. Strings that already match the whole format
+        are not normalized, and a missing month or day (e.g. "%G年") counts as 1.
+        Keys ignore microseconds and time zones.
+        """
+        return cls._compile_sort_key(format_string, get_era_table())
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _compile_sort_key(cls, format_string, table):
+        """Compiles the sort key function for the format string and era table snapshot."""
+        regex = cls._compile_regex_pattern(format_string, table)
+
+        def match_components(date_string):
+            # Canonical strings are matched as is; normalization is only skipped when the
+            # whole string matches, since it could change a trailing part (e.g. "〇" to "0")
+            match = regex.match(date_string)
+            if not match or match.end() != len(date_string):
+                match = regex.match(cls._standardize_date_strings(date_string))
+            if not match:
+                raise ValueError(f"time data '{date_string}' does not match format '{format_string}'")
+            return match.groupdict()
+
+        if regex is None:
+            # Formats without custom era codes are parsed by datetime
+            def sort_key(date_string):
+                dt = cls.strptime(date_string, format_string)
+                return cls._make_sort_key(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+            return sort_key
+
+        groups = set(regex.groupindex)
+        era_group = next((group for group in table.era_indexes if group in groups), None)
+        if era_group and groups <= {era_group, 'era_year', 'month', 'day', 'hour', 'minute', 'second'}:
+            # Fast path on digit groups and an era start year lookup
+            start_years = {name: era['start_date'].year - 1 for name, era in table.era_indexes[era_group].items()}
+            has_month, has_day = 'month' in groups, 'day' in groups
+            has_time = bool(groups & {'hour', 'minute', 'second'})
+
+            def sort_key(date_string):
+                components = match_components(date_string)
+                era_year = components['era_year']
+                year = start_years[components[era_group]] + (1 if era_year in ('元', 'First') else int(era_year))
+                month = int(components['month']) if has_month else 1
+                day = int(components['day']) if has_day else 1
+                if not has_time:
+                    return cls._make_sort_key(year, month, day)
+                return cls._make_sort_key(year, month, day, int(components.get('hour') or 0),
+                                          int(components.get('minute') or 0), int(components.get('second') or 0))
+            return sort_key
+
+        def sort_key(date_string):
+            components = match_components(date_string)
+            year, month, day = cls._extract_date_components(components, table, partial=True)
+            hour, minute, second = cls._extract_time_components(components)[:3]
+            return cls._make_sort_key(year, month, day, hour, minute, second)
+        return sort_key
+
+    @staticmethod
+    def _make_sort_key(year, month, day, hour=0, minute=0, second=0):
+        """Packs the date and time fields into a single integer."""
+        return ((year * 100 + month) * 100 + day) * 1000000 + (hour * 100 + minute) * 100 + second
+
+    @classmethod
+    def strptime_batch(cls, date_strings, format_string, workers=None):
+        """Parses each date string, splitting the work across a thread pool of the given size."""
+        return _map_batch(lambda date_string: cls.strptime(date_string, format_string), date_strings, workers)
+
+    @classmethod
+    def strftime_batch(cls, dates, format_string, workers=None):
+        """Formats each date or datetime, splitting the work across a thread pool of the given size."""
+        def format_date(value):
+            if not isinstance(value, cls):
+                value = cls._from_date(value)
+            return value.strftime(format_string)
+        return _map_batch(format_date, dates, workers)
+
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _compile_format_segments(cls, format_string):
+        """Compiles the format string into era segments and standard strftime chunks."""
+        segments = []
+        chunk = ''
+        for token_type, token_value in cls._tokenize_format_string(format_string):
+            if token_type == 'format_code':
+                modifier, code = token_value
+                if code in cls.custom_formats:
+                    if chunk:
+                        segments.append((False, chunk))
+                        chunk = ''
+                    segments.append((True, (cls.custom_formats[code]['format'], modifier)))
+                else:
+                    chunk += '%' + modifier + code
+            else:
+                # Escape literals so that the merged chunk can be passed to strftime
+                chunk += token_value.replace('%', '%%')
+        if chunk:
+            segments.append((False, chunk))
+        return tuple(segments)
+
+    @classmethod
+    def _from_date(cls, value):
+        """Converts a date or datetime object into a jpdatetime object."""
+        if isinstance(value, datetime):
+            return cls(value.year, value.month, value.day, value.hour, value.minute,
+                       value.second, value.microsecond, value.tzinfo)
+        return cls(value.year, value.month, value.day)
+
     @classmethod
     def _tokenize_format_string(cls, format_string):
         """Tokenizes the format string into format codes and literals, including modifiers."""
@@ -106,63 +237,101 @@ class jpdatetime(datetime):
                 tokens.append(('literal', part))
         return tokens
 
+    @classmethod
+    @lru_cache(maxsize=128)
+    def _compile_regex_pattern(cls, format_string, table):
+        """Compiles the regex pattern for formats with custom era codes, or returns None."""
+        if not any(re.search(f'%[-#]*{code}', format_string) for code in cls.custom_formats):
+            return None
+        return re.compile(cls._build_regex_pattern(format_string, table))
+
+    @classmethod
+    def _build_regex_pattern(cls, format_string, table=None):
+        """Builds the regex pattern for parsing date strings in the given format."""
+        table = table or get_era_table()
+        # Split the format string into tokens
+        tokens = cls._tokenize_format_string(format_string)
+        regex_pattern = ''
+        for token_type, token_value in tokens:
+            if token_type == 'format_code':
+                modifier, code = token_value
+                if code in cls.custom_formats:
+                    # Get the regex pattern for the custom format code
+                    handler_name = cls.custom_formats[code]['parse']
+                    handler = getattr(cls, f"_get_regex_{handler_name}")
+                    regex_pattern += handler(table)
+                else:
+                    # Use the standard datetime regex patterns
+                    regex_pattern += cls._escape_regex('%' + code)
+            else:
+                # Escape literals in the regex pattern
+                regex_pattern += re.escape(token_value)
+        return regex_pattern
+
     @staticmethod
     def _escape_regex(format_code):
         """Escapes standard format codes for regex."""
         regex_patterns = {
             '%Y': r'(?P<year>\d{4})',
+            '%y': r'(?P<short_year>\d{2})',
             '%m': r'(?P<month>\d{1,2})',
             '%d': r'(?P<day>\d{1,2})',
+            '%j': r'(?P<day_of_year>\d{1,3})',
             '%B': r'(?P<month_name>[A-Za-z]+)',
-            # Add other standard patterns as needed
+            '%b': r'(?P<month_abbr>[A-Za-z]{3})',
+            '%A': r'(?P<weekday_name>[A-Za-z]+|[月火水木金土日]曜日)',
+            '%a': r'(?P<weekday_abbr>[A-Za-z]{3}|[月火水木金土日])',
+            '%H': r'(?P<hour>\d{1,2})',
+            '%I': r'(?P<hour12>\d{1,2})',
+            '%p': r'(?P<am_pm>AM|PM|am|pm|午前|午後)',
+            '%M': r'(?P<minute>\d{1,2})',
+            '%S': r'(?P<second>\d{1,2})',
+            '%f': r'(?P<microsecond>\d{1,6})',
+            '%z': r'(?P<utc_offset>Z|[+-]\d{2}:?\d{2}(?::?\d{2})?)',
         }
         return regex_patterns.get(format_code, re.escape(format_code))
 
     @classmethod
-    def _get_regex_parse_full_jp_era(cls):
+    def _get_regex_parse_full_jp_era(cls, table):
         """Returns the regex pattern for full Japanese era names."""
-        era_names = '|'.join([era['name_ja'] for era in eras])
+        era_names = table.regex_fragments['era_full_jp']
         return rf'(?P<era_full_jp>{era_names})(?P<era_year>元|\d+)'
 
     @classmethod
-    def _get_regex_parse_abbr_jp_era(cls):
+    def _get_regex_parse_abbr_jp_era(cls, table):
         """Returns the regex pattern for abbreviated Japanese era names."""
-        era_abbrs = ''.join([era['name_ja'][0] for era in eras])
+        era_abbrs = table.regex_fragments['era_abbr_jp']
         return rf'(?P<era_abbr_jp>[{era_abbrs}])(?P<era_year>元|\d+)'
 
     @classmethod
-    def _get_regex_parse_full_en_era(cls):
+    def _get_regex_parse_full_en_era(cls, table):
         """Returns the regex pattern for full English era names."""
-        era_names = '|'.join([era['name_en'] for era in eras])
+        era_names = table.regex_fragments['era_full_en']
         return rf'(?P<era_full_en>{era_names}) (?P<era_year>First|\d+)'
 
     @classmethod
-    def _get_regex_parse_abbr_en_era(cls):
+    def _get_regex_parse_abbr_en_era(cls, table):
         """Returns the regex pattern for abbreviated English era names."""
-        era_abbrs = ''.join([era['name_en'][0] for era in eras])
+        era_abbrs = table.regex_fragments['era_abbr_en']
         return rf'(?P<era_abbr_en>[{era_abbrs}])(?P<era_year>First|\d+)'
 
     @classmethod
-    def _extract_date_components(cls, components):
-        """Extracts and calculates the date components from regex match groups."""
+    def _extract_date_components(cls, components, table=None, partial=False):
+        """Extracts and calculates the date components from regex match groups.
+
+        With partial, a missing month or day defaults to 1 instead of raising.
+        """
+        table = table or get_era_table()
         # Initialize default values
         year = month = day = None
 
         # Handle era information
         era = None
         era_year_str = components.get('era_year')
-        if 'era_full_jp' in components and components['era_full_jp']:
-            era_name = components['era_full_jp']
-            era = next((e for e in eras if e['name_ja'] == era_name), None)
-        elif 'era_abbr_jp' in components and components['era_abbr_jp']:
-            era_abbr = components['era_abbr_jp']
-            era = next((e for e in eras if e['name_ja'][0] == era_abbr), None)
-        elif 'era_full_en' in components and components['era_full_en']:
-            era_name = components['era_full_en']
-            era = next((e for e in eras if e['name_en'] == era_name), None)
-        elif 'era_abbr_en' in components and components['era_abbr_en']:
-            era_abbr = components['era_abbr_en']
-            era = next((e for e in eras if e['name_en'][0] == era_abbr), None)
+        for group, era_index in table.era_indexes.items():
+            if components.get(group):
+                era = era_index.get(components[group])
+                break
 
         # Determine the era year
         if era and era_year_str:
@@ -175,6 +344,10 @@ class jpdatetime(datetime):
         # Handle standard year if era is not used
         if not year and 'year' in components:
             year = int(components['year'])
+        elif not year and components.get('short_year'):
+            # Follow the POSIX convention used by datetime.strptime
+            short_year = int(components['short_year'])
+            year = short_year + (1900 if short_year >= 69 else 2000)
 
         # Handle month
         if 'month' in components and components['month']:
@@ -182,31 +355,73 @@ class jpdatetime(datetime):
         elif 'month_name' in components and components['month_name']:
             month_name = components['month_name']
             month = datetime.strptime(month_name, '%B').month
+        elif components.get('month_abbr'):
+            month = datetime.strptime(components['month_abbr'], '%b').month
 
         # Handle day
         if 'day' in components and components['day']:
             day = int(components['day'])
 
+        # Handle day of the year when month and day are not given
+        if year and components.get('day_of_year') and None in (month, day):
+            ordinal_date = datetime(year, 1, 1) + timedelta(days=int(components['day_of_year']) - 1)
+            if ordinal_date.year != year:
+                raise ValueError(f"day of year {components['day_of_year']} is out of range for {year}")
+            month, day = ordinal_date.month, ordinal_date.day
+
+        if partial and year is not None:
+            month = month or 1
+            day = day or 1
+
         if None in (year, month, day):
             raise ValueError("Incomplete date information")
 
         return year, month, day
 
+    @classmethod
+    def _extract_time_components(cls, components):
+        """Extracts the time components and timezone from regex match groups."""
+        hour = int(components.get('hour') or 0)
+        if components.get('hour12'):
+            hour = int(components['hour12']) % 12
+            if components.get('am_pm') in ('PM', 'pm', '午後'):
+                hour += 12
+        minute = int(components.get('minute') or 0)
+        second = int(components.get('second') or 0)
+        # Fractions are right-padded, so "5" means 500000 microseconds
+        microsecond = int((components.get('microsecond') or '0').ljust(6, '0'))
+
+        tzinfo = None
+        utc_offset = components.get('utc_offset')
+        if utc_offset == 'Z':
+            tzinfo = timezone.utc
+        elif utc_offset:
+            digits = utc_offset[1:].replace(':', '')
+            offset = timedelta(hours=int(digits[0:2]), minutes=int(digits[2:4]), seconds=int(digits[4:6] or 0))
+            tzinfo = timezone(-offset if utc_offset[0] == '-' else offset)
+        return hour, minute, second, microsecond, tzinfo
+
     def _standardize_date_strings(data_strings):
         """Standardize the input strings through replace kanji to num and NFKC normalizer"""
         data_strings = replace_kanji_numerals(data_strings)
         return unicodedata.normalize('NFKC', data_strings)
 
-    def _get_era_info(self):
+    def _get_era_info(self, table=None):
         """Retrieves the era information for the current date."""
-        for era in eras:
-            if self >= era['start_date']:
-                return era
-        raise ValueError("Date out of range for Japanese eras")
+        return (table or get_era_table()).get_era(self)
+
+    def _get_next_era_boundary(self, table=None):
+        """Returns the next date on which the era name or era year changes."""
+        boundary = datetime(self.year + 1, 1, 1) if self.year < MAXYEAR else datetime.max
+        next_start_date = (table or get_era_table()).get_next_start_date(self)
+        if next_start_date is not None:
+            boundary = min(boundary, next_start_date)
+        # Keep the boundary comparable with aware datetimes
+        return boundary.replace(tzinfo=self.tzinfo)
 
-    def _format_full_jp_era(self, modifier=''):
+    def _format_full_jp_era(self, modifier='', table=None):
         """Formats the date using full Japanese era name."""
-        era = self._get_era_info()
+        era = self._get_era_info(table)
         era_year = self.year - era['start_date'].year + 1
         if era_year == 1:
             era_year_str = '元'
@@ -217,9 +432,9 @@ class jpdatetime(datetime):
                 era_year_str = f"{era_year:02d}"  # Zero-pad to two digits
         return f"{era['name_ja']}{era_year_str}"
 
-    def _format_abbr_jp_era(self, modifier=''):
+    def _format_abbr_jp_era(self, modifier='', table=None):
         """Formats the date using abbreviated Japanese era name."""
-        era = self._get_era_info()
+        era = self._get_era_info(table)
         era_abbr = era['name_ja'][0]
         era_year = self.year - era['start_date'].year + 1
         if era_year == 1:
@@ -234,9 +449,9 @@ class jpdatetime(datetime):
                 era_year_str = f"{era_year:02d}"
         return f"{era_abbr}{era_year_str}"
 
-    def _format_full_en_era(self, modifier=''):
+    def _format_full_en_era(self, modifier='', table=None):
         """Formats the date using full English era name."""
-        era = self._get_era_info()
+        era = self._get_era_info(table)
         era_year = self.year - era['start_date'].year + 1
         if era_year == 1:
             if '-' in modifier or '#' in modifier:
@@ -250,9 +465,9 @@ class jpdatetime(datetime):
                 era_year_str = f"{era_year:02d}"
         return f"{era['name_en']} {era_year_str}"
 
-    def _format_abbr_en_era(self, modifier=''):
+    def _format_abbr_en_era(self, modifier='', table=None):
         """Formats the date using abbreviated English era name."""
-        era = self._get_era_info()
+        era = self._get_era_info(table)
         era_abbr = era['name_en'][0]
         era_year = self.year - era['start_date'].year + 1
         if era_year == 1:
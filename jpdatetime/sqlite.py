@@ -0,0 +1,70 @@
+import json
+from datetime import datetime, timedelta
+from .era_table import get_era_table
+from .jpdatetime import jpdatetime
+
+UNIX_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_jpdatetime(value):
+    """Converts an SQLite date value (ISO 8601 text or Unix time) into a jpdatetime object."""
+    if isinstance(value, (int, float)):
+        dt = UNIX_EPOCH + timedelta(seconds=value)
+    else:
+        dt = datetime.fromisoformat(value)
+    # Era boundaries are wall-clock dates, so the local date is used as is
+    return jpdatetime._from_date(dt.replace(tzinfo=None))
+
+
+def _jp_strftime(value, format_string):
+    if value is None or format_string is None:
+        return None
+    return _to_jpdatetime(value).strftime(format_string)
+
+
+def _jp_strptime(date_string, format_string):
+    if date_string is None or format_string is None:
+        return None
+    # Same text representation as SQLite's datetime()
+    return jpdatetime.strptime(date_string, format_string).isoformat(sep=' ')
+
+
+def _jp_era(value):
+    if value is None:
+        return None
+    return _to_jpdatetime(value)._get_era_info()['name_ja']
+
+
+class _EraCounts:
+    """Aggregate counting the rows per era, returned as a JSON object ordered from the newest era."""
+
+    def __init__(self):
+        self.table = get_era_table()
+        self.counts = [0] * len(self.table.ascending)
+
+    def step(self, value):
+        if value is not None:
+            self.counts[self.table.get_era_index(_to_jpdatetime(value))] += 1
+
+    def finalize(self):
+        ascending = self.table.ascending
+        return json.dumps({
+            ascending[i]['name_ja']: self.counts[i]
+            for i in reversed(range(len(self.counts))) if self.counts[i]
+        }, ensure_ascii=False)
+
+
+def register_sqlite(conn):
+    """Registers the era conversion functions on an sqlite3 connection.
+
+    Scalar functions: jp_strftime(date, format), jp_strptime(text, format) and
+    jp_era(date). Aggregate: jp_era_counts(date). Dates are ISO 8601 text or
+    Unix time; jp_strptime returns text in the same format as SQLite's datetime().
+    The functions are not registered as deterministic because their results
+    change when load_eras() swaps the era table.
+    """
+    conn.create_function('jp_strftime', 2, _jp_strftime)
+    conn.create_function('jp_strptime', 2, _jp_strptime)
+    conn.create_function('jp_era', 1, _jp_era)
+    conn.create_aggregate('jp_era_counts', 1, _EraCounts)
+    return conn
@@ -15,6 +15,7 @@ setup(
     long_description_content_type="text/markdown",
     license = 'Apache-2.0 license',
     install_requires=[],
+    extras_require={'arrow': ['pyarrow']},
     packages=find_packages(),
     package_data={'': ['config/*.json']},
 )
\ No newline at end of file
@@ -0,0 +1,124 @@
+import unittest
+from datetime import date, datetime
+from jpdatetime import jpdatetime
+
+try:
+    import pyarrow as pa
+    from jpdatetime import arrow
+except ImportError:
+    pa = None
+
+@unittest.skipUnless(pa, "pyarrow is not installed")
+class TestArrow(unittest.TestCase):
+    def setUp(self):
+        self.dates = [
+            date(2023, 10, 30),
+            None,
+            date(2019, 5, 1),
+            date(2019, 4, 30),
+            date(1989, 1, 7),
+            date(1926, 12, 25),
+            date(715, 10, 3),
+        ]
+        self.array = pa.array(self.dates, pa.date32())
+
+    def test_era_names(self):
+        result = arrow.era_names(self.array)
+        self.assertIsInstance(result, pa.DictionaryArray)
+        self.assertEqual(result.to_pylist(), ["令和", None, "令和", "平成", "昭和", "昭和", "霊亀"])
+        self.assertEqual(arrow.era_names(self.array, 'abbr_en').to_pylist(), ["R", None, "R", "H", "S", "S", "R"])
+
+    def test_era_names_chunked_with_empty_and_null_chunks(self):
+        chunked = pa.chunked_array([pa.array([date(2020, 1, 1)]), pa.array([], pa.date32()),
+                                    pa.array([None], pa.date32())])
+        result = arrow.era_names(chunked)
+        self.assertEqual(result.to_pylist(), ["令和", None])
+        self.assertEqual(result.type, pa.dictionary(pa.int16(), pa.string()))
+        self.assertEqual(arrow.era_years(chunked).to_pylist(), [2, None])
+
+    def test_era_names_invalid_column(self):
+        with self.assertRaises(ValueError):
+            arrow.era_names(self.array, 'name_fr')
+
+    def test_era_years(self):
+        self.assertEqual(arrow.era_years(self.array).to_pylist(), [5, None, 1, 31, 64, 1, 1])
+
+    def test_strftime(self):
+        for format_string in ["%G年%m月%d日", "%-G年%m月%d日", "%g年%m月%d日", "%-g年%m月%d日",
+                              "%E, %B %d", "%-E, %B %d", "%e/%m/%d", "%-e/%m/%d"]:
+            with self.subTest(format_string=format_string):
+                expected = [jpdatetime(d.year, d.month, d.day).strftime(format_string) if d else None
+                            for d in self.dates]
+                self.assertEqual(arrow.strftime(self.array, format_string).to_pylist(), expected)
+
+    def test_strftime_unpadded_standard_codes(self):
+        for format_string in ["%G年%-m月%-d日", "%-e.%-m.%d (%-j)", "%E, %B %-d"]:
+            with self.subTest(format_string=format_string):
+                expected = [jpdatetime(d.year, d.month, d.day).strftime(format_string) if d else None
+                            for d in self.dates]
+                self.assertEqual(arrow.strftime(self.array, format_string).to_pylist(), expected)
+        array = pa.array([datetime(2019, 5, 1, 0, 5, 7), datetime(2019, 5, 1, 13, 5, 7)], pa.timestamp('s'))
+        self.assertEqual(arrow.strftime(array, "%e %-I:%M %p %-H:%-M:%-S").to_pylist(),
+                         ["R01 12:05 AM 0:5:7", "R01 1:05 PM 13:5:7"])
+
+    def test_strftime_unsupported_modifier(self):
+        with self.assertRaises(ValueError):
+            arrow.strftime(self.array, "%G %-B")
+        with self.assertRaises(ValueError):
+            arrow.strftime(self.array, "%G %#m")
+
+    def test_strftime_timestamp(self):
+        array = pa.array([datetime(2019, 5, 1, 13, 5), None], pa.timestamp('us'))
+        self.assertEqual(arrow.strftime(array, "%G年%m月%d日 %H:%M").to_pylist(), ["令和元年05月01日 13:05", None])
+
+    def test_strftime_chunked(self):
+        chunked = pa.chunked_array([self.array, self.array.slice(0, 2)])
+        result = arrow.strftime(chunked, "%e/%m/%d")
+        self.assertIsInstance(result, pa.ChunkedArray)
+        self.assertEqual(result.num_chunks, 2)
+        self.assertEqual(result.to_pylist()[-2:], ["R05/10/30", None])
+
+    def test_strftime_workers(self):
+        chunked = pa.chunked_array([self.array] * 4)
+        expected = arrow.strftime(chunked, "%G年%m月%d日").to_pylist()
+        self.assertEqual(arrow.strftime(chunked, "%G年%m月%d日", workers=4).to_pylist(), expected)
+
+    def test_strptime(self):
+        test_cases = [
+            (["令和05年10月30日", None, "令和元年05月01日", "平成三〇年四月一日", "霊亀元年10月03日"], "%G年%m月%d日",
+             [date(2023, 10, 30), None, date(2019, 5, 1), date(2018, 4, 1), date(715, 10, 3)]),
+            (["令05年10月30日", "平1年01月08日"], "%g年%m月%d日", [date(2023, 10, 30), date(1989, 1, 8)]),
+            (["Reiwa 01, May 01", "Ｈｅｉｓｅｉ　３０，　Ａｐｒｉｌ　０１"], "%E, %B %d", [date(2019, 5, 1), date(2018, 4, 1)]),
+            (["R1/05/01", "H30/04/01", None], "%e/%m/%d", [date(2019, 5, 1), date(2018, 4, 1), None]),
+        ]
+        for strings, format_string, expected in test_cases:
+            with self.subTest(format_string=format_string):
+                result = arrow.strptime(pa.array(strings, pa.string()), format_string)
+                self.assertEqual(result.type, pa.date32())
+                self.assertEqual(result.to_pylist(), expected)
+
+    def test_strptime_invalid(self):
+        with self.assertRaises(ValueError):
+            arrow.strptime(pa.array(["X1/05/01"]), "%e/%m/%d")
+
+    def test_strptime_standard_directives(self):
+        test_cases = [
+            (["R01 May 01", "H30 apr 01", None], "%e %b %d", [date(2019, 5, 1), date(2018, 4, 1), None]),
+            (["H30 032", None], "%e %j", [date(2018, 2, 1), None]),
+            (["令和6年5月1日(水) 午後1時5分"], "%G年%m月%d日(%a) %p%I時%M分", [date(2024, 5, 1)]),
+            (["R06/05/01 23:30 -0100"], "%e/%m/%d %H:%M %z", [date(2024, 5, 1)]),
+        ]
+        for strings, format_string, expected in test_cases:
+            with self.subTest(format_string=format_string):
+                self.assertEqual(arrow.strptime(pa.array(strings, pa.string()), format_string).to_pylist(), expected)
+
+    def test_strptime_month_name_case(self):
+        result = arrow.strptime(pa.array(["Reiwa 01, may 01", "Heisei 30, APRIL 01", None]), "%E, %B %d")
+        self.assertEqual(result.to_pylist(), [date(2019, 5, 1), date(2018, 4, 1), None])
+
+    def test_strptime_invalid_month_name(self):
+        with self.assertRaises(ValueError):
+            arrow.strptime(pa.array(["Reiwa 01, May 01", "Reiwa 01, Foo 01"]), "%E, %B %d")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,311 @@
+import json
+import os
+import tempfile
+import unittest
+from array import array
+from collections import Counter
+from datetime import date, datetime
+from jpdatetime import (jpdatetime, load_eras, reload_eras, era_year_to_gregorian, gregorian_to_era_years,
+                        era_year_to_gregorian_batch, gregorian_to_era_years_batch, encode_eras, era_categories)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+from jpdatetime.era_table import EraTable, get_era_table, eras_file_path
+
+class TestEraTable(unittest.TestCase):
+    def setUp(self):
+        self.table = EraTable([
+            {"name_ja": "令和", "name_en": "Reiwa", "start_date": "2019-05-01"},
+            {"name_ja": "平成", "name_en": "Heisei", "start_date": "1989-01-08"},
+            {"name_ja": "昭和", "name_en": "Shōwa", "start_date": "1926-12-25"},
+        ])
+
+    def test_parallel_eras(self):
+        table = EraTable([
+            {"name_ja": "丁", "name_en": "Tei", "start_date": "2010-01-01"},
+            {"name_ja": "甲", "name_en": "Kou", "start_date": "2000-01-01"},
+            {"name_ja": "乙", "name_en": "Otsu", "start_date": "2005-01-01"},
+            {"name_ja": "戊", "name_en": "Bo", "start_date": "1990-01-01"},
+        ])
+        self.assertEqual([era['name_ja'] for era in table.eras], ["丁", "甲", "乙", "戊"])
+        self.assertEqual([era['name_ja'] for era in table.ascending], ["戊", "甲", "丁"])
+        # Dates use the era listed first; the parallel era is only looked up by name
+        self.assertEqual(table.get_era(datetime(2006, 1, 1))['name_ja'], "甲")
+        self.assertEqual(table.find_era("Otsu")['name_ja'], "乙")
+
+    def test_default_table_northern_court(self):
+        # Dates during the Northern and Southern Courts period use the Northern Court eras
+        test_cases = [
+            (jpdatetime(1337, 1, 1), "延元02年01月01日"),
+            (jpdatetime(1340, 5, 25), "暦応03年05月25日"),
+            (jpdatetime(1366, 1, 1), "貞治05年01月01日"),
+            (jpdatetime(1384, 6, 1), "至徳元年06月01日"),
+        ]
+        for dt, expected in test_cases:
+            with self.subTest(dt=dt):
+                self.assertEqual(dt.strftime("%G年%m月%d日"), expected)
+        self.assertEqual(jpdatetime.strptime("正平20年1月1日", "%G年%m月%d日"), datetime(1366, 1, 1))
+
+    def test_tables_are_compared_by_identity(self):
+        self.assertNotEqual(self.table, EraTable(self.table.eras))
+        # Caches keyed on the table do not mix up tables with the same generation
+        self.assertNotEqual(jpdatetime._compile_regex_pattern("%G", self.table).pattern,
+                            jpdatetime._compile_regex_pattern("%G", get_era_table()).pattern)
+
+    def test_get_era(self):
+        test_cases = [
+            (datetime(2019, 5, 1), "令和"),
+            (datetime(2019, 4, 30, 23, 59), "平成"),
+            (datetime(1989, 1, 7), "昭和"),
+            (datetime(1926, 12, 25), "昭和"),
+        ]
+        for dt, expected in test_cases:
+            with self.subTest(dt=dt):
+                self.assertEqual(self.table.get_era(dt)['name_ja'], expected)
+
+    def test_get_era_out_of_range(self):
+        with self.assertRaises(ValueError):
+            self.table.get_era(datetime(1926, 12, 24))
+
+    def test_get_next_start_date(self):
+        self.assertEqual(self.table.get_next_start_date(datetime(2000, 1, 1)), datetime(2019, 5, 1))
+        self.assertIsNone(self.table.get_next_start_date(datetime(2020, 1, 1)))
+
+    def test_era_indexes(self):
+        self.assertEqual(self.table.era_indexes['era_abbr_en']['S']['name_ja'], "昭和")
+        self.assertEqual(self.table.era_indexes['era_full_jp']['令和']['name_en'], "Reiwa")
+
+    def test_table_is_read_only(self):
+        with self.assertRaises(TypeError):
+            self.table.eras[0]['name_ja'] = "改変"
+        with self.assertRaises(TypeError):
+            self.table.era_indexes['era_full_jp']['改変'] = self.table.eras[0]
+
+    def test_empty_table(self):
+        with self.assertRaises(ValueError):
+            EraTable([])
+
+    def test_default_table(self):
+        self.assertEqual(get_era_table().eras[0]['name_ja'], "令和")
+        self.assertEqual(get_era_table().eras[-1]['name_ja'], "霊亀")
+
+class TestEraYears(unittest.TestCase):
+    def test_era_year_to_gregorian(self):
+        test_cases = [
+            ("令和", 1, 2019),
+            ("R", 2, 2020),
+            ("平成", 30, 2018),
+            ("平", 31, 2019),
+            ("Shōwa", 64, 1989),
+            ("S", 1, 1926),
+            ("明治", 45, 1912),
+            ("霊亀", 1, 715),
+        ]
+        for era, era_year, expected in test_cases:
+            with self.subTest(era=era, era_year=era_year):
+                self.assertEqual(era_year_to_gregorian(era, era_year), expected)
+
+    def test_era_year_to_gregorian_out_of_range(self):
+        for era, era_year in [("昭和", 65), ("平成", 32), ("令和", 0), ("不明", 1)]:
+            with self.subTest(era=era, era_year=era_year):
+                with self.assertRaises(ValueError):
+                    era_year_to_gregorian(era, era_year)
+
+    def test_gregorian_to_era_years(self):
+        test_cases = [
+            (2024, (("令和", 6),)),
+            (2019, (("平成", 31), ("令和", 1))),
+            (2018, (("平成", 30),)),
+            (1989, (("昭和", 64), ("平成", 1))),
+            (1926, (("大正", 15), ("昭和", 1))),
+            (1868, (("慶応", 4), ("明治", 1))),
+            (2100, (("令和", 82),)),
+        ]
+        for year, expected in test_cases:
+            with self.subTest(year=year):
+                self.assertEqual(gregorian_to_era_years(year), expected)
+
+    def test_gregorian_to_era_years_out_of_range(self):
+        with self.assertRaises(ValueError):
+            gregorian_to_era_years(714)
+
+    def test_gregorian_to_era_years_with_month(self):
+        test_cases = [
+            (2019, 4, (("平成", 31),)),
+            (2019, 5, (("令和", 1),)),
+            (1989, 1, (("昭和", 64), ("平成", 1))),
+            (1989, 2, (("平成", 1),)),
+            (715, 10, (("霊亀", 1),)),
+            (2100, 12, (("令和", 82),)),
+        ]
+        for year, month, expected in test_cases:
+            with self.subTest(year=year, month=month):
+                self.assertEqual(gregorian_to_era_years(year, month), expected)
+        for year, month in [(715, 9), (2019, 13)]:
+            with self.subTest(year=year, month=month):
+                with self.assertRaises(ValueError):
+                    gregorian_to_era_years(year, month)
+
+    def test_parallel_courts(self):
+        test_cases = [
+            (("正平", 20), 1366),
+            (("暦応", 4), 1341),
+            (("延元", 5), 1340),
+            (("元中", 9), 1392),
+        ]
+        for (era, era_year), expected in test_cases:
+            with self.subTest(era=era, era_year=era_year):
+                self.assertEqual(era_year_to_gregorian(era, era_year), expected)
+        for era, era_year in [("元中", 10), ("延元", 6), ("暦応", 6)]:
+            with self.subTest(era=era, era_year=era_year):
+                with self.assertRaises(ValueError):
+                    era_year_to_gregorian(era, era_year)
+        self.assertEqual(gregorian_to_era_years(1345), (("興国", 6), ("康永", 4), ("貞和", 1)))
+        self.assertEqual(gregorian_to_era_years(1366), (("正平", 20), ("貞治", 5)))
+        self.assertEqual(gregorian_to_era_years(1392), (("元中", 9), ("明徳", 3)))
+        self.assertEqual(gregorian_to_era_years(1393), (("明徳", 4),))
+        self.assertEqual(gregorian_to_era_years(1340, 4), (("延元", 5), ("暦応", 3)))
+        self.assertEqual(gregorian_to_era_years(1392, 12), (("明徳", 3),))
+
+    def test_era_start_on_new_year(self):
+        table = EraTable([
+            {"name_ja": "乙", "name_en": "Otsu", "start_date": "2001-01-01"},
+            {"name_ja": "甲", "name_en": "Kou", "start_date": "1990-06-01"},
+        ])
+        self.assertEqual(table.gregorian_to_era_years(2000), (("甲", 11),))
+        self.assertEqual(table.gregorian_to_era_years(2001), (("乙", 1),))
+        with self.assertRaises(ValueError):
+            table.era_year_to_gregorian("甲", 12)
+
+    def test_batch(self):
+        self.assertEqual(era_year_to_gregorian_batch(["令和", "H", "昭和"], [2, 30, 64]), [2020, 2018, 1989])
+        self.assertEqual(gregorian_to_era_years_batch([2018, 2019]),
+                         [(("平成", 30),), (("平成", 31), ("令和", 1))])
+        self.assertEqual(gregorian_to_era_years_batch([2019, 2019], [4, 5]), [(("平成", 31),), (("令和", 1),)])
+
+class TestEraCodes(unittest.TestCase):
+    def setUp(self):
+        self.dates = [date(2023, 10, 30), None, datetime(2019, 5, 1, 12), date(2019, 4, 30),
+                      date(1989, 1, 7).toordinal(), date(715, 10, 3)]
+
+    def test_encode_eras(self):
+        codes, era_years = encode_eras(self.dates)
+        self.assertIsInstance(codes, array)
+        self.assertIsInstance(era_years, array)
+        categories = era_categories()
+        self.assertEqual([categories[code] if code >= 0 else None for code in codes],
+                         ["令和", None, "令和", "平成", "昭和", "霊亀"])
+        self.assertEqual(list(era_years), [5, 0, 1, 31, 64, 1])
+        self.assertEqual(era_categories('name_en')[codes[0]], "Reiwa")
+
+    def test_codes_follow_chronological_order(self):
+        codes, era_years = encode_eras([date(1989, 1, 7), date(1989, 1, 8), date(2019, 5, 1)])
+        self.assertEqual(list(codes), sorted(codes))
+        self.assertEqual(len(set(codes)), 3)
+
+    def test_group_by_codes(self):
+        dates = [date(2020, 1, 1), date(2018, 1, 1), date(2021, 1, 1), date(1980, 1, 1)]
+        codes, era_years = encode_eras(dates)
+        categories = era_categories()
+        counts = {categories[code]: count for code, count in Counter(codes).items()}
+        self.assertEqual(counts, {"令和": 2, "平成": 1, "昭和": 1})
+
+    @unittest.skipUnless(np, "numpy is not installed")
+    def test_encode_eras_numpy_integers(self):
+        values = [np.int64(date(2019, 4, 30).toordinal()), np.int32(date(2019, 5, 1).toordinal())]
+        codes, era_years = encode_eras(values)
+        self.assertEqual([era_categories()[code] for code in codes], ["平成", "令和"])
+        self.assertEqual(list(era_years), [31, 1])
+
+    def test_encode_eras_out_of_range(self):
+        with self.assertRaises(ValueError):
+            encode_eras([date(700, 1, 1)])
+
+    def test_unknown_category_column(self):
+        with self.assertRaises(ValueError):
+            era_categories('name_fr')
+
+    @unittest.skipUnless(np, "numpy is not installed")
+    def test_encode_eras_datetime64(self):
+        values = np.array(['2023-10-30', 'NaT', '2019-05-01T12:00', '2019-04-30', '1989-01-07', '0715-10-03'],
+                          dtype='datetime64[m]')
+        codes, era_years = encode_eras(values)
+        expected_codes, expected_years = encode_eras(self.dates)
+        self.assertEqual(codes.dtype, np.int16)
+        self.assertEqual(codes.tolist(), list(expected_codes))
+        self.assertEqual(era_years.tolist(), list(expected_years))
+
+    @unittest.skipUnless(np, "numpy is not installed")
+    def test_encode_eras_ordinal_array(self):
+        values = np.array([date(2019, 4, 30).toordinal(), date(2019, 5, 1).toordinal()])
+        codes, era_years = encode_eras(values)
+        self.assertEqual([era_categories()[code] for code in codes], ["平成", "令和"])
+        self.assertEqual(era_years.tolist(), [31, 1])
+        with self.assertRaises(ValueError):
+            encode_eras(np.array([date(700, 1, 1).toordinal()]))
+
+class TestLoadEras(unittest.TestCase):
+    def setUp(self):
+        with open(eras_file_path, 'r', encoding='utf-8') as f:
+            self.eras_data = json.load(f)
+        self.new_era = {"name_ja": "新元", "name_en": "Shingen", "start_date": "2040-04-01"}
+
+    def tearDown(self):
+        load_eras(eras_file_path)
+
+    def test_load_eras_from_data(self):
+        old_table = get_era_table()
+        table = load_eras([self.new_era] + self.eras_data)
+        self.assertIs(get_era_table(), table)
+        self.assertEqual(table.generation, old_table.generation + 1)
+        self.assertNotEqual(table, old_table)
+        self.assertEqual(jpdatetime(2041, 1, 1).strftime("%G年%m月%d日"), "新元02年01月01日")
+        self.assertEqual(jpdatetime.strptime("新元元年4月1日", "%G年%m月%d日"), datetime(2040, 4, 1))
+        self.assertEqual(jpdatetime(2040, 3, 31).strftime("%e/%m/%d"), "R22/03/31")
+
+    def test_load_eras_from_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'eras.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump([self.new_era] + self.eras_data, f, ensure_ascii=False)
+            load_eras(path)
+            self.assertEqual(jpdatetime(2040, 4, 1).strftime("%-E"), "Shingen 1")
+            # Reloading reads the file again
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(self.eras_data, f, ensure_ascii=False)
+            reload_eras()
+            self.assertEqual(jpdatetime(2040, 4, 1).strftime("%-E"), "Reiwa 22")
+
+    def test_reload_eras_restores_default(self):
+        load_eras([self.new_era] + self.eras_data)
+        load_eras(eras_file_path)
+        self.assertEqual(jpdatetime(2041, 1, 1).strftime("%G"), "令和23")
+        with self.assertRaises(ValueError):
+            jpdatetime.strptime("新元元年4月1日", "%G年%m月%d日")
+
+    def test_encode_eras_with_snapshot(self):
+        table = get_era_table()
+        codes, era_years = encode_eras([date(2041, 1, 1)], table=table)
+        load_eras([self.new_era] + self.eras_data)
+        # The codes are decoded with the table they were encoded with
+        self.assertEqual(era_categories(table=table)[codes[0]], "令和")
+        self.assertEqual(era_categories()[encode_eras([date(2041, 1, 1)])[0][0]], "新元")
+
+    def test_in_flight_snapshot(self):
+        labels = jpdatetime.format_range(datetime(2040, 3, 31), datetime(2040, 4, 2), "%G年%m月%d日")
+        self.assertEqual(next(labels), "令和22年03月31日")
+        # A range walk that already started keeps its snapshot across the swap
+        load_eras([self.new_era] + self.eras_data)
+        self.assertEqual(next(labels), "令和22年04月01日")
+        self.assertEqual(jpdatetime(2040, 4, 1).strftime("%G"), "新元元")
+
+    def test_invalid_data_keeps_current_table(self):
+        table = get_era_table()
+        with self.assertRaises(ValueError):
+            load_eras([])
+        self.assertIs(get_era_table(), table)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from array import array
+from datetime import date
+from unittest import mock
+from jpdatetime import jpdatetime
+from jpdatetime.fixed_width import iter_ordinals, read_ordinals
+
+class TestFixedWidth(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_records(self, records, encoding, field_width):
+        path = os.path.join(self.tmpdir.name, 'records.dat')
+        with open(path, 'wb') as f:
+            for record_id, field in records:
+                encoded = field.encode(encoding)
+                f.write(record_id.encode('ascii') + encoded + b' ' * (field_width - len(encoded)) + b'\n')
+        return path
+
+    def test_utf8_records(self):
+        records = [
+            ('0001', '令和05年10月30日'),
+            ('0002', '令和元年05月01日'),
+            ('0003', '平成３０年０４月０１日'),
+            ('0004', '昭和64年01月07日'),
+            ('0005', '大正十五年一二月二十四日'),
+        ]
+        path = self.write_records(records, 'utf-8', 40)
+        result = list(iter_ordinals(path, '%G年%m月%d日', record_length=45, offset=4, width=40))
+        expected = [
+            date(2023, 10, 30).toordinal(),
+            date(2019, 5, 1).toordinal(),
+            date(2018, 4, 1).toordinal(),
+            date(1989, 1, 7).toordinal(),
+            date(1926, 12, 24).toordinal(),
+        ]
+        self.assertEqual(result, expected)
+
+    def test_shift_jis_records(self):
+        records = [
+            ('0001', '令05年10月30日'),
+            ('0002', '平１年０１月０８日'),
+        ]
+        path = self.write_records(records, 'shift_jis', 24)
+        result = read_ordinals(path, '%g年%m月%d日', record_length=29, offset=4, width=24, encoding='shift_jis')
+        self.assertIsInstance(result, array)
+        self.assertEqual(list(result), [date(2023, 10, 30).toordinal(), date(1989, 1, 8).toordinal()])
+
+    def test_first_year_without_fallback(self):
+        test_cases = [
+            ('令元年05月01日', '%g年%m月%d日', date(2019, 5, 1)),
+            ('平成元年01月08日', '%G年%m月%d日', date(1989, 1, 8)),
+        ]
+        for field, format_string, expected in test_cases:
+            with self.subTest(field=field, format_string=format_string):
+                path = self.write_records([('0001', field)], 'shift_jis', 24)
+                # Records with 元 are parsed on the bytes path without calling strptime
+                with mock.patch.object(jpdatetime, 'strptime', side_effect=AssertionError("fallback used")):
+                    result = list(iter_ordinals(path, format_string, record_length=29, offset=4, width=24,
+                                                encoding='shift_jis'))
+                self.assertEqual(result, [expected.toordinal()])
+
+    def test_output_array(self):
+        records = [('0001', 'R05/10/30'), ('0002', 'H30/04/01')]
+        path = self.write_records(records, 'ascii', 10)
+        out = array('i', [0])
+        self.assertIs(read_ordinals(path, '%e/%m/%d', record_length=15, offset=4, width=10, out=out), out)
+        self.assertEqual(list(out), [0, date(2023, 10, 30).toordinal(), date(2018, 4, 1).toordinal()])
+
+    def test_empty_file(self):
+        path = self.write_records([], 'ascii', 10)
+        self.assertEqual(list(iter_ordinals(path, '%e/%m/%d', record_length=15)), [])
+
+    def test_invalid_field(self):
+        path = self.write_records([('0001', 'XXXXXXXX')], 'ascii', 10)
+        with self.assertRaises(ValueError):
+            list(iter_ordinals(path, '%e/%m/%d', record_length=15, offset=4, width=10))
+
+    def test_unsupported_format_code(self):
+        path = self.write_records([('0001', 'R05/10/30')], 'ascii', 10)
+        with self.assertRaises(ValueError):
+            list(iter_ordinals(path, '%e/%m/%d %H', record_length=15, offset=4, width=10))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
-from datetime import datetime
-from jpdatetime import jpdatetime
+from datetime import datetime, date, timedelta, timezone
+from jpdatetime import jpdatetime, get_era_table
 
 class Testjpdatetime(unittest.TestCase):
     def setUp(self):
@@ -305,5 +305,139 @@ class Testjpdatetime(unittest.TestCase):
                 result = jpdatetime.strptime(date_string, format_string)
                 self.assertEqual(result, expected_date)
 
+    def test_strptime_standard_directives(self):
+        jst = timezone(timedelta(hours=9))
+        test_cases = [
+            ("令和6年5月1日 13時05分", "%G年%m月%d日 %H時%M分", datetime(2024, 5, 1, 13, 5)),
+            ("令和六年五月一日 十三時五分", "%G年%m月%d日 %H時%M分", datetime(2024, 5, 1, 13, 5)),
+            ("令和６年５月１日　１３：０５：０９", "%G年%m月%d日 %H:%M:%S", datetime(2024, 5, 1, 13, 5, 9)),
+            ("R06/05/01 13:05:09.25", "%e/%m/%d %H:%M:%S.%f", datetime(2024, 5, 1, 13, 5, 9, 250000)),
+            ("令和6年5月1日(水) 午後1時5分", "%G年%m月%d日(%a) %p%I時%M分", datetime(2024, 5, 1, 13, 5)),
+            ("令和6年5月1日(水) 午前12時5分", "%G年%m月%d日(%a) %p%I時%M分", datetime(2024, 5, 1, 0, 5)),
+            ("Reiwa 06, Wed 01 May 01:05 PM", "%E, %a %d %b %I:%M %p", datetime(2024, 5, 1, 13, 5)),
+            ("R06/05/01 13:05 +0900", "%e/%m/%d %H:%M %z", datetime(2024, 5, 1, 13, 5, tzinfo=jst)),
+            ("R06/05/01 04:05 Z", "%e/%m/%d %H:%M %z", datetime(2024, 5, 1, 4, 5, tzinfo=timezone.utc)),
+            ("H30 032", "%e %j", datetime(2018, 2, 1)),
+        ]
+        for date_string, format_string, expected_date in test_cases:
+            with self.subTest(date_string=date_string, format_string=format_string):
+                result = jpdatetime.strptime(date_string, format_string)
+                self.assertEqual(result, expected_date)
+                self.assertEqual(result.tzinfo, expected_date.tzinfo)
+
+    def test_strptime_strftime_round_trip_with_timezone(self):
+        format_string = "%e/%m/%d %H:%M %z"
+        result = jpdatetime.strptime("R06/05/01 13:05 +0900", format_string)
+        self.assertEqual(result.strftime(format_string), "R06/05/01 13:05 +0900")
+        # The era follows the local wall-clock date, not the UTC date
+        result = jpdatetime.strptime("H31/04/30 23:30 -0100", format_string)
+        self.assertEqual(result.strftime("%G年%m月%d日"), "平成31年04月30日")
+
+    def test_strptime_day_of_year_out_of_range(self):
+        with self.assertRaises(ValueError):
+            jpdatetime.strptime("H30 366", "%e %j")
+
+    def test_sort_key(self):
+        date_strings = ["令和元年5月1日", "平成三〇年十二月二四日", "令和０５年１０月３０日", "昭和64年1月7日",
+                        "平成元年1月8日", "大正15年12月24日", "令和5年10月29日"]
+        key = jpdatetime.key_func("%G年%m月%d日")
+        expected = sorted(date_strings, key=lambda s: jpdatetime.strptime(s, "%G年%m月%d日"))
+        self.assertEqual(sorted(date_strings, key=key), expected)
+        self.assertEqual(jpdatetime.sort_key("令和元年5月1日", "%G年%m月%d日"), key("令和元年5月1日"))
+
+    def test_sort_key_range_filter(self):
+        lower = jpdatetime.sort_key("平成20年", "%G年")
+        upper = jpdatetime.sort_key("令和2年", "%G年")
+        key = jpdatetime.key_func("%e/%m/%d")
+        date_strings = ["H19/12/31", "H20/01/01", "H31/04/30", "R01/05/01", "R02/01/01", "R02/01/02"]
+        self.assertEqual([s for s in date_strings if lower <= key(s) <= upper],
+                         ["H20/01/01", "H31/04/30", "R01/05/01", "R02/01/01"])
+
+    def test_sort_key_with_time(self):
+        key = jpdatetime.key_func("%G年%m月%d日 %p%I時%M分")
+        self.assertLess(key("令和6年5月1日 午前11時59分"), key("令和6年5月1日 午後0時0分"))
+        self.assertLess(key("令和6年5月1日 午後11時59分"), key("令和6年5月2日 午前0時0分"))
+
+    def test_sort_key_standard_format(self):
+        key = jpdatetime.key_func("%Y-%m-%d %H:%M")
+        self.assertLess(key("2019-04-30 23:59"), key("2019-05-01 00:00"))
+
+    def test_sort_key_invalid(self):
+        with self.assertRaises(ValueError):
+            jpdatetime.sort_key("invalid", "%G年%m月%d日")
+
+    def test_sort_key_partial_match(self):
+        # The raw string matches only up to "3", but normalization turns "3〇" into "30"
+        for date_string, format_string in [("R6/1/3〇", "%e/%m/%d"), ("令和6年1月3〇日", "%G年%m月%d日")]:
+            with self.subTest(date_string=date_string):
+                dt = jpdatetime.strptime(date_string, format_string)
+                self.assertEqual(jpdatetime.sort_key(date_string, format_string),
+                                 jpdatetime._make_sort_key(dt.year, dt.month, dt.day, 0, 0, 0))
+
+    def test_format_range(self):
+        test_cases = [
+            # Era boundary (Shōwa to Heisei)
+            (datetime(1988, 12, 25), datetime(1989, 1, 15), "%G年%m月%d日", timedelta(days=1)),
+            # Era boundary (Heisei to Reiwa)
+            (datetime(2019, 4, 25), datetime(2019, 5, 5), "%-e/%m/%d", timedelta(days=1)),
+            # Year boundary
+            (datetime(2019, 12, 30), datetime(2020, 1, 3), "%E, %B %d", timedelta(days=1)),
+            # Multiple era codes with weekly steps
+            (datetime(1910, 1, 1), datetime(1930, 1, 1), "%g(%-G) %Y-%m-%d %% %a", timedelta(days=7)),
+            # Standard format codes only
+            (datetime(2020, 2, 27), datetime(2020, 3, 2), "%Y/%m/%d %H:%M", timedelta(hours=12)),
+        ]
+        for start, end, format_string, step in test_cases:
+            with self.subTest(start=start, end=end, format_string=format_string):
+                expected = []
+                current = jpdatetime(start.year, start.month, start.day)
+                while current < end:
+                    expected.append(current.strftime(format_string))
+                    current += step
+                result = list(jpdatetime.format_range(start, end, format_string, step))
+                self.assertEqual(result, expected)
+
+    def test_format_range_with_date(self):
+        result = list(jpdatetime.format_range(date(2019, 4, 30), date(2019, 5, 2), "%G年%m月%d日"))
+        self.assertEqual(result, ["平成31年04月30日", "令和元年05月01日"])
+
+    def test_format_range_with_timezone(self):
+        jst = timezone(timedelta(hours=9))
+        start = datetime(2019, 4, 30, 12, tzinfo=jst)
+        result = list(jpdatetime.format_range(start, start + timedelta(days=2), "%G年%m月%d日 %z"))
+        self.assertEqual(result, ["平成31年04月30日 +0900", "令和元年05月01日 +0900"])
+
+    def test_format_range_invalid_step(self):
+        with self.assertRaises(ValueError):
+            list(jpdatetime.format_range(date(2019, 4, 30), date(2019, 5, 2), "%G", timedelta(0)))
+
+    def test_eras_alias(self):
+        from jpdatetime.jpdatetime import eras
+        self.assertEqual(eras[0]['name_ja'], "令和")
+        self.assertEqual(eras[0]['start_date'], datetime(2019, 5, 1))
+        self.assertIs(eras, get_era_table().eras)
+
+    def test_strptime_batch(self):
+        date_strings = [date_string for date_string, format_string, expected in self.test_cases_strptime_G
+                        if format_string == "%G年%m月%d日"]
+        expected = [jpdatetime.strptime(date_string, "%G年%m月%d日") for date_string in date_strings]
+        for workers in (None, 1, 4):
+            with self.subTest(workers=workers):
+                result = jpdatetime.strptime_batch(date_strings, "%G年%m月%d日", workers=workers)
+                self.assertEqual(result, expected)
+
+    def test_strptime_batch_invalid(self):
+        with self.assertRaises(ValueError):
+            jpdatetime.strptime_batch(["令和05年10月30日", "invalid"], "%G年%m月%d日", workers=2)
+
+    def test_strftime_batch(self):
+        dates = [date for date, format_string, expected in self.test_cases_strftime_e]
+        dates.append(datetime(2019, 5, 1))
+        expected = [jpdatetime._from_date(date).strftime("%-e/%m/%d") for date in dates]
+        for workers in (None, 1, 4):
+            with self.subTest(workers=workers):
+                result = jpdatetime.strftime_batch(dates, "%-e/%m/%d", workers=workers)
+                self.assertEqual(result, expected)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,55 @@
+import json
+import sqlite3
+import unittest
+from jpdatetime.sqlite import register_sqlite
+
+class TestSqlite(unittest.TestCase):
+    def setUp(self):
+        self.conn = register_sqlite(sqlite3.connect(':memory:'))
+        self.conn.execute("CREATE TABLE records (d TEXT, wareki TEXT)")
+        self.conn.executemany("INSERT INTO records VALUES (?, ?)", [
+            ("2023-10-30", "令和05年10月30日"),
+            ("2019-05-01 09:30:00", "令和元年05月01日"),
+            ("2019-04-30", "平成31年04月30日"),
+            ("1989-01-07", "昭和64年01月07日"),
+            (None, None),
+        ])
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_jp_strftime(self):
+        rows = self.conn.execute("SELECT jp_strftime(d, '%G年%m月%d日') FROM records").fetchall()
+        self.assertEqual([row[0] for row in rows],
+                         ["令和05年10月30日", "令和元年05月01日", "平成31年04月30日", "昭和64年01月07日", None])
+
+    def test_jp_strftime_unix_time(self):
+        row = self.conn.execute("SELECT jp_strftime(1556668800, '%e/%m/%d')").fetchone()
+        self.assertEqual(row[0], "R01/05/01")
+
+    def test_jp_strptime(self):
+        rows = self.conn.execute("SELECT jp_strptime(wareki, '%G年%m月%d日') FROM records").fetchall()
+        self.assertEqual([row[0] for row in rows],
+                         ["2023-10-30 00:00:00", "2019-05-01 00:00:00", "2019-04-30 00:00:00",
+                          "1989-01-07 00:00:00", None])
+        # The result can be used with SQLite's date functions
+        row = self.conn.execute("SELECT date(jp_strptime('平成三〇年十二月二四日', '%G年%m月%d日'), '+7 days')").fetchone()
+        self.assertEqual(row[0], "2018-12-31")
+
+    def test_jp_era_group_by(self):
+        rows = self.conn.execute(
+            "SELECT jp_era(d) AS era, count(*) FROM records WHERE d IS NOT NULL GROUP BY era ORDER BY min(d)"
+        ).fetchall()
+        self.assertEqual(rows, [("昭和", 1), ("平成", 1), ("令和", 2)])
+
+    def test_jp_era_counts(self):
+        row = self.conn.execute("SELECT jp_era_counts(d) FROM records").fetchone()
+        self.assertEqual(json.loads(row[0]), {"令和": 2, "平成": 1, "昭和": 1})
+        self.assertEqual(list(json.loads(row[0])), ["令和", "平成", "昭和"])
+
+    def test_invalid_value(self):
+        with self.assertRaises(sqlite3.OperationalError):
+            self.conn.execute("SELECT jp_strptime('invalid', '%G年%m月%d日')").fetchone()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from jpdatetime import jpdatetime
+
+def make_date_strings(count, format_string):
+    random.seed(0)
+    start = datetime(1900, 1, 1)
+    dates = [start + timedelta(days=random.randrange(45000)) for _ in range(count)]
+    return jpdatetime.strftime_batch(dates, format_string)
+
+def bench(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare sorting wareki strings by key_func against parse-then-sort.')
+    parser.add_argument('--count', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--format', default='%G年%m月%d日')
+    args = parser.parse_args()
+
+    date_strings = make_date_strings(args.count, args.format)
+    key = jpdatetime.key_func(args.format)
+    parsed = bench(lambda: sorted(date_strings, key=lambda s: jpdatetime.strptime(s, args.format)), args.repeat)
+    keyed = bench(lambda: sorted(date_strings, key=key), args.repeat)
+    print(f"{args.count} strings in '{args.format}'")
+    print(f"{'parse-then-sort':>16} {parsed:8.3f}s")
+    print(f"{'key_func':>16} {keyed:8.3f}s ({parsed / keyed:.2f}x)")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+import argparse
+import os
+import random
+import sys
+import sysconfig
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from jpdatetime import jpdatetime
+
+def make_date_strings(count, format_string):
+    random.seed(0)
+    start = datetime(1900, 1, 1)
+    dates = [start + timedelta(days=random.randrange(45000)) for _ in range(count)]
+    return jpdatetime.strftime_batch(dates, format_string)
+
+def bench(date_strings, format_string, workers, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        jpdatetime.strptime_batch(date_strings, format_string, workers=workers)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure strptime_batch scaling across thread counts.')
+    parser.add_argument('--count', type=int, default=200000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--format', default='%G年%m月%d日')
+    args = parser.parse_args()
+
+    gil_disabled = bool(sysconfig.get_config_var('Py_GIL_DISABLED'))
+    print(f"Python {sys.version.split()[0]} (free-threaded: {gil_disabled}), {args.count} strings")
+    date_strings = make_date_strings(args.count, args.format)
+    baseline = bench(date_strings, args.format, None, args.repeat)
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8}")
+    print(f"{'serial':>8} {baseline:10.3f} {1.0:8.2f}")
+    for workers in range(1, args.max_workers + 1):
+        elapsed = bench(date_strings, args.format, workers, args.repeat)
+        print(f"{workers:>8} {elapsed:10.3f} {baseline / elapsed:8.2f}")
+
+if __name__ == '__main__':
+    main()